@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-from typing import Any, Optional, List
+import webbrowser
+from typing import Any, Optional, List, Tuple
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.command import CommandPalette, Hit, Hits, Provider
 from textual.containers import Horizontal, Vertical
 from textual.message import Message
+from textual.timer import Timer
 from textual.worker import Worker, WorkerState
 from rich.text import Text
 from textual.widgets import (
+    Footer,
     Header,
     Input,
     ListView,
@@ -19,6 +22,7 @@ from textual.widgets import (
 )
 
 from .config import (
+    HEADLINES_MOUNT_BATCH,
     HOME_PAGE_URL,
     load_config,
     load_read_articles,
@@ -41,7 +45,7 @@ class ThemeProvider(Provider):
         """Search for a theme."""
         matcher = self.matcher(query)
 
-        for theme_name in self.app.themes:
+        for theme_name in self.app.theme_names:
             score = matcher.match(theme_name)
             if score > 0:
                 yield Hit(
@@ -82,18 +86,23 @@ class NewsApp(App):
         self.current_section: Optional[Section] = None
         self._theme_name = theme or "dracula"
         self.stories: List[Story] = []
+        # Lower-cased searchable text for each story, rebuilt with self.stories.
+        self._search_index: List[Tuple[str, Story]] = []
         self.read_articles: set[str] = set()
         self.bookmarks: List[dict] = []
+        self.theme_names: List[str] = []
         self.config = config or {}
         self.source_manager = SourceManager(self.config)
         sources = self.source_manager.get_all_sources()
         self.source = sources[0] if sources else None
         self.meta_sections = self.config.get("meta_sections", {})
         self.sections: List[Section] = []
+        self._prefetch_timer: Optional[Timer] = None
+        self._headlines_generation = 0
 
     @property
     def theme_name(self) -> str:
-        return self._theme_name
+        return self.theme
 
     def get_keybinding_style(self) -> str:
         """Return the appropriate keybinding style for the current theme."""
@@ -104,22 +113,13 @@ class NewsApp(App):
     def apply_theme_styles(self, screen) -> None:
         """Apply theme-specific styles to a screen."""
         is_cbc = self.theme_name.startswith("cbc-")
-        try:
-            header = screen.query_one(Header)
-            header.set_class(is_cbc, "cbc-header")
-        except Exception:
-            pass  # Not all screens have a header
-
-        try:
-            # The main app screen has a StatusBar, others have a Footer.
-            footer = screen.query_one(StatusBar)
-            footer.set_class(is_cbc, "cbc-footer")
-        except Exception:
-            try:
-                footer = screen.query_one(Footer)
-                footer.set_class(is_cbc, "cbc-footer")
-            except Exception:
-                pass  # Not all screens have a footer
+        # Not all screens have a header; queries with no match are no-ops.
+        screen.query(Header).set_class(is_cbc, "cbc-header")
+        # The main app screen has a StatusBar, others have a Footer.
+        for status_bar in screen.query(StatusBar):
+            status_bar.set_class(is_cbc, "cbc-footer")
+            status_bar.refresh_key_color()
+        screen.query(Footer).set_class(is_cbc, "cbc-footer")
 
 
 
@@ -144,9 +144,10 @@ class NewsApp(App):
         self.screen.bindings = self.BINDINGS
 
         # Register all themes
-        self.themes = load_themes()
+        self.themes = load_themes(self.config)
         for name, theme in self.themes.items():
             self.register_theme(theme)
+        self.theme_names = sorted(self.themes)
 
         self.theme = self._theme_name
         self.apply_theme_styles(self.screen)
@@ -161,12 +162,10 @@ class NewsApp(App):
             return
 
         # Start loading sections on mount
-        self.run_worker(self.source.get_sections, name="sections_loader", thread=True)
-        # focus sections list if possible
-        try:
-            self.query_one("#sections-list").focus()
-        except Exception:
-            pass
+        self.run_worker(
+            self.source.get_sections_cached, name="sections_loader", thread=True
+        )
+        self.query_one("#sections-list").focus()
 
         # Configure the headlines list
         self.query_one("#headlines-list", ListView).cursor_type = "row"
@@ -174,26 +173,28 @@ class NewsApp(App):
         keybindings_text = self.config.get("ui", {}).get(
             "statusbar_keybindings", UI_DEFAULTS["statusbar_keybindings"]
         )
-        self.query_one(StatusBar).set_keybindings(
-            keybindings_text.format(color=self.get_keybinding_style())
-        )
+        self.query_one(StatusBar).set_keybindings(keybindings_text)
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
-        name = getattr(event.worker, "name", None)
-        # handle only finished SUCCESS states for sections/headlines
-        if name == "sections_loader" and event.state is WorkerState.SUCCESS:
-            self._handle_sections_loaded(event)
-        elif name == "headlines_loader" and event.state is WorkerState.SUCCESS:
-            self._handle_headlines_loaded(event)
-        elif name == "headlines_loader" and event.state is WorkerState.ERROR:
-            self._handle_headlines_error(event)
-        elif name == "headlines_loader" and event.state not in (
-            WorkerState.PENDING,
-            WorkerState.RUNNING,
-            WorkerState.SUCCESS,
-        ):
-            # headlines worker finished but not successful => show empty/failure message
-            self._handle_headlines_loaded(event)
+        state = event.state
+        # only finished workers are of interest
+        if state is WorkerState.PENDING or state is WorkerState.RUNNING:
+            return
+        name = event.worker.name
+        if name == "sections_loader":
+            if state is WorkerState.SUCCESS:
+                self._handle_sections_loaded(event)
+        elif name == "headlines_loader":
+            if state is WorkerState.ERROR:
+                self._handle_headlines_error(event)
+            else:
+                # a cancelled worker has no result => show empty list
+                self._handle_headlines_loaded(event)
+        elif name == "open_browser":
+            if state is WorkerState.ERROR or (
+                state is WorkerState.SUCCESS and not event.worker.result
+            ):
+                self.notify("Could not open a web browser.", severity="error")
 
     def _handle_sections_loaded(self, event: Worker.StateChanged) -> None:
         view = self.query_one("#sections-list", ListView)
@@ -203,7 +204,7 @@ class NewsApp(App):
         ]
 
         # Filter sections based on config
-        enabled_sections = self.config.get("sections")
+        enabled_sections = set(self.config.get("sections") or ())
         if enabled_sections:
             self.sections = [s for s in self.sections if s.title in enabled_sections]
 
@@ -221,15 +222,12 @@ class NewsApp(App):
             self._load_headlines_for_section(self.current_section)
         else:
             # No sections, clear headlines
-            self.query_one("#headlines-list", ListView).clear()
+            self._clear_headlines()
 
     def _handle_headlines_error(self, event: Worker.StateChanged) -> None:
         self.query_one(StatusBar).loading_status = "Error loading headlines."
         headlines_list = self.query_one("#headlines-list", ListView)
-        try:
-            headlines_list.query_one(LoadingIndicator).remove()
-        except Exception:
-            pass
+        headlines_list.query(LoadingIndicator).remove()
 
         error = getattr(event.worker, "error", None)
         if error:
@@ -241,47 +239,71 @@ class NewsApp(App):
 
         headlines_list.display = True
 
-    def _update_headlines_list(self, stories: List[Story]) -> None:
-        """Sorts stories by read status and updates the headlines list."""
-        # Sort stories by read status (unread first)
-        sorted_stories = sorted(stories, key=lambda s: s.read)
+    def _set_stories(self, stories: List[Story]) -> None:
+        """Store the stories unread first, with their search text."""
+        self.stories = sorted(stories, key=lambda s: s.read)
+        self._search_index = [
+            (f"{s.title}\n{s.section}\n{s.flag or ''}".lower(), s)
+            for s in self.stories
+        ]
 
+    def _clear_headlines(self) -> ListView:
+        """Empty the headlines list and drop any rows still queued for it."""
         headlines_list = self.query_one("#headlines-list", ListView)
         headlines_list.clear()
+        # Invalidates batches still queued for a previous list.
+        self._headlines_generation += 1
+        return headlines_list
+
+    def _update_headlines_list(self, stories: List[Story]) -> None:
+        """Updates the headlines list; stories are already in display order."""
+        headlines_list = self._clear_headlines()
 
-        if not sorted_stories:
+        if not stories:
             headlines_list.display = False
             return
 
-        for s in sorted_stories:
+        headlines_list.display = True
+        self._mount_headlines(stories, 0, self._headlines_generation)
+
+    def _mount_headlines(
+        self, stories: List[Story], start: int, generation: int
+    ) -> None:
+        """Mount a batch of headline rows, deferring the rest to later refreshes.
+
+        The first batch fills the visible list straight away; rows further
+        down are added after each repaint rather than all before the first.
+        """
+        if generation != self._headlines_generation:
+            return
+        end = start + HEADLINES_MOUNT_BATCH
+        items = []
+        for s in stories[start:end]:
             item = HeadlineItem(s)
             if s.read:
                 item.add_class("read")
-            headlines_list.append(item)
-
-        headlines_list.display = True
+            items.append(item)
+        self.query_one("#headlines-list", ListView).extend(items)
+        if end < len(stories):
+            self.call_after_refresh(self._mount_headlines, stories, end, generation)
 
     def _handle_headlines_loaded(self, event: Worker.StateChanged) -> None:
         self.query_one(StatusBar).loading_status = ""
         headlines_list = self.query_one("#headlines-list", ListView)
-        try:
-            headlines_list.query_one(LoadingIndicator).remove()
-        except Exception:
-            pass
+        headlines_list.query(LoadingIndicator).remove()
         stories = getattr(event.worker, "result", None) or []
         bookmarked_urls = {b["url"] for b in self.bookmarks}
         for s in stories:
             s.read = s.url in self.read_articles
             s.bookmarked = s.url in bookmarked_urls
-        self.stories = stories
+        self._set_stories(stories)
         self._update_headlines_list(self.stories)
 
     def _initiate_headline_load(self, story_loader_callable, title: str) -> None:
         """Shared logic to start loading headlines."""
         self.query_one(StatusBar).loading_status = f"Loading {title}..."
         self.query_one(Input).value = ""
-        headlines_list = self.query_one("#headlines-list", ListView)
-        headlines_list.clear()
+        headlines_list = self._clear_headlines()
         headlines_list.mount(LoadingIndicator())
         self.run_worker(
             story_loader_callable,
@@ -297,7 +319,9 @@ class NewsApp(App):
             self._load_headlines_for_meta_section(section)
             return
 
-        self._initiate_headline_load(lambda: self.source.get_stories(section), section.title)
+        self._initiate_headline_load(
+            lambda: self.source.get_stories_cached(section), section.title
+        )
 
     def _load_headlines_for_meta_section(self, section: Section) -> None:
         meta_section_name = section.url.replace("meta:", "")
@@ -306,16 +330,22 @@ class NewsApp(App):
             return
 
         def _get_stories():
+            wanted = set(section_names)
+            by_title: dict[str, List[Section]] = {}
+            for s in self.sections:
+                if s.title in wanted:
+                    by_title.setdefault(s.title, []).append(s)
+            sections = [s for name in section_names for s in by_title.get(name, [])]
+            # Fetch the constituent sections concurrently, then merge them
+            # in the configured order.
+            results = self.source.get_stories_batch(sections)
             all_stories = []
             seen_urls = set()
-            for section_name in section_names:
-                for s in self.sections:
-                    if s.title == section_name:
-                        stories = self.source.get_stories(s)
-                        for story in stories:
-                            if story.url not in seen_urls:
-                                all_stories.append(story)
-                                seen_urls.add(story.url)
+            for s in sections:
+                for story in results[s.url]:
+                    if story.url not in seen_urls:
+                        all_stories.append(story)
+                        seen_urls.add(story.url)
             return all_stories
 
         self._initiate_headline_load(_get_stories, section.title)
@@ -330,15 +360,40 @@ class NewsApp(App):
             if isinstance(event.item, HeadlineItem):
                 self._open_story(event.item.story)
 
+    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+        # Prefetch the highlighted story once the cursor settles on it.
+        if event.list_view.id == "headlines-list" and isinstance(
+            event.item, HeadlineItem
+        ):
+            if self._prefetch_timer is not None:
+                self._prefetch_timer.stop()
+            story = event.item.story
+            self._prefetch_timer = self.set_timer(0.3, lambda: self.prefetch(story))
+
+    def prefetch(self, story: Story) -> None:
+        """Load a story's content into the source cache in the background."""
+        self.run_worker(
+            lambda: self.source.get_story_content_cached(story),
+            name="story_prefetch",
+            group="story_prefetch",
+            thread=True,
+            exclusive=True,
+            exit_on_error=False,
+        )
+
     def _open_story(self, story: Story) -> None:
         story.read = True
         self.read_articles.add(story.url)
         save_read_articles(self.read_articles)
+        # Reading a story moves it below the unread ones.
+        self._set_stories(self.stories)
         self._update_headlines_list(self.stories)
         self.push_screen(StoryViewScreen(story, self.source))
 
     def action_refresh(self) -> None:
         if self.current_section:
+            self.source.clear_sections_cache()
+            self.source.clear_stories_cache()
             self._load_headlines_for_section(self.current_section)
 
     def action_nav_left(self) -> None:
@@ -367,13 +422,7 @@ class NewsApp(App):
             if not query:
                 self._update_headlines_list(self.stories)
                 return
-            filtered_stories = [
-                s
-                for s in self.stories
-                if query in s.title.lower()
-                or query in s.section.lower()
-                or (s.flag and query in s.flag.lower())
-            ]
+            filtered_stories = [s for text, s in self._search_index if query in text]
             self._update_headlines_list(filtered_stories)
 
     def on_input_blur(self, event: Input.Blur) -> None:
@@ -415,7 +464,26 @@ class NewsApp(App):
         # reload config and sections
         self.config = load_config()
         self.meta_sections = self.config.get("meta_sections", {})
-        self.run_worker(self.source.get_sections, name="sections_loader", thread=True)
+        # Unchanged sources are reused, keeping their sessions and caches.
+        self.source_manager = SourceManager(self.config)
+        sources = self.source_manager.get_all_sources()
+        self.source = sources[0] if sources else self.source
+        self.run_worker(
+            self.source.get_sections_cached, name="sections_loader", thread=True
+        )
+
+    def open_url(self, url: str, *, new_tab: bool = True) -> None:
+        """Open a URL in the browser without blocking the UI."""
+        if self._driver is None or self._driver.is_web:
+            # Web drivers hand the URL to the client's browser.
+            super().open_url(url, new_tab=new_tab)
+            return
+        self.run_worker(
+            lambda: webbrowser.open(url, new=2 if new_tab else 0),
+            name="open_browser",
+            thread=True,
+            exit_on_error=False,
+        )
 
     def action_switch_theme(self, theme: str) -> None:
         """Switch to a new theme."""
@@ -423,9 +491,8 @@ class NewsApp(App):
 
     def watch_theme(self, old_theme: str, new_theme: str) -> None:
         """Apply theme-specific styles."""
-        if hasattr(self, "screens"):
-            for screen in self.screens.values():
-                self.apply_theme_styles(screen)
+        for screen in self.screen_stack:
+            self.apply_theme_styles(screen)
 
     def action_toggle_left_pane(self) -> None:
         """Toggle the left pane."""
@@ -5,16 +5,33 @@ import logging
 import os
 import re
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 import importlib.resources
 import shutil
 
+from urllib3.util import make_headers
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from textual.theme import Theme
+
 # --- Configuration ---
 HOME_PAGE_URL = "https://www.cbc.ca/lite"
 SECTIONS_PAGE_URL = "https://www.cbc.ca/lite/sections"
 DOMAIN_BASE = "https://www.cbc.ca"
 HTTP_TIMEOUT = 15
+HTTP_POOL_SIZE = 32
+FETCH_CONCURRENCY = 5
+SECTIONS_CACHE_TTL = 300
+STORIES_CACHE_TTL = 120
+STORY_CACHE_SIZE = 64
+HTTP_CACHE_SIZE = 128
 MIN_ARTICLE_WORDS = 15
+HEADLINES_MOUNT_BATCH = 40
 
 CONFIG_PATH = os.path.expanduser("~/.config/news/config.json")
 READ_ARTICLES_FILE = os.path.expanduser("~/.config/news/read_articles.json")
@@ -24,7 +41,10 @@ REQUEST_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:115.0) "
         "Gecko/20100101 Firefox/115.0"
-    )
+    ),
+    "Connection": "keep-alive",
+    # Only advertise encodings urllib3 can decode in this environment.
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
 }
 RETRY_ATTEMPTS = 4
 INITIAL_RETRY_DELAY = 0.5
@@ -60,13 +80,27 @@ def setup_logging(debug: bool = False) -> Optional[str]:
     return debug_path
 
 
+def _read_json(path: str) -> Any:
+    """Decode a JSON file, with orjson when it is installed."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _write_json(path: str, data: Any) -> None:
+    """Write compact JSON for files only the app reads back."""
+    if orjson:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+
 def load_read_articles() -> set[str]:
     """Load the set of read article URLs from the config file."""
-    if not os.path.exists(READ_ARTICLES_FILE):
-        return set()
     try:
-        with open(READ_ARTICLES_FILE, "r") as f:
-            return set(json.load(f))
+        return set(_read_json(READ_ARTICLES_FILE))
     except (IOError, json.JSONDecodeError):
         return set()
 
@@ -74,30 +108,42 @@ def load_read_articles() -> set[str]:
 def save_read_articles(read_articles: set[str]) -> None:
     """Save the set of read article URLs to the config file."""
     try:
-        with open(READ_ARTICLES_FILE, "w") as f:
-            json.dump(list(read_articles), f)
+        _write_json(READ_ARTICLES_FILE, list(read_articles))
     except IOError:
         pass
 
 
+# Last bookmarks list read from or written to BOOKMARKS_FILE. The dicts are
+# copied in and out so callers can edit bookmarks without touching it.
+_bookmarks_cache: Dict[str, Any] = {"val": None, "mtime": None}
+
+
 def load_bookmarks() -> list[dict]:
     """Load the list of bookmarked articles from the config file."""
-    if not os.path.exists(BOOKMARKS_FILE):
+    try:
+        mtime = os.path.getmtime(BOOKMARKS_FILE)
+    except OSError:
         return []
+    # Only re-read the file if it changed since we last read or wrote it.
+    if _bookmarks_cache["val"] is not None and _bookmarks_cache["mtime"] == mtime:
+        return [dict(b) for b in _bookmarks_cache["val"]]
     try:
-        with open(BOOKMARKS_FILE, "r") as f:
-            return json.load(f)
+        bookmarks = _read_json(BOOKMARKS_FILE)
     except (IOError, json.JSONDecodeError):
         return []
+    _bookmarks_cache["val"] = bookmarks
+    _bookmarks_cache["mtime"] = mtime
+    return [dict(b) for b in bookmarks]
 
 
 def save_bookmarks(bookmarks: list[dict]) -> None:
     """Save the list of bookmarked articles to the config file."""
     try:
-        with open(BOOKMARKS_FILE, "w") as f:
-            json.dump(bookmarks, f)
+        _write_json(BOOKMARKS_FILE, bookmarks)
     except IOError:
-        pass
+        return
+    _bookmarks_cache["val"] = [dict(b) for b in bookmarks]
+    _bookmarks_cache["mtime"] = os.path.getmtime(BOOKMARKS_FILE)
 
 
 def ensure_config_file_exists() -> None:
@@ -113,12 +159,15 @@ def ensure_config_file_exists() -> None:
 
 def load_config() -> Dict[str, Any]:
     """Load the main configuration file."""
-    ensure_config_file_exists()
     try:
-        with open(CONFIG_PATH, "r") as f:
-            config = json.load(f)
-            logger.info("Loaded config from %s", CONFIG_PATH)
-            return config
+        try:
+            config = _read_json(CONFIG_PATH)
+        except FileNotFoundError:
+            # First run: install the default config, then read it.
+            ensure_config_file_exists()
+            config = _read_json(CONFIG_PATH)
+        logger.info("Loaded config from %s", CONFIG_PATH)
+        return config
     except (IOError, json.JSONDecodeError) as e:
         logger.error("Failed to load config from %s: %s", CONFIG_PATH, e)
         return {}
@@ -135,13 +184,22 @@ def save_config(config: Dict[str, Any]) -> None:
         logger.error("Failed to save config to %s: %s", CONFIG_PATH, e)
 
 
-from textual.theme import Theme
-from .default_themes import DEFAULT_THEMES
+# Themes built by load_themes, keyed by the user theme definitions.
+_themes_cache: Dict[str, Dict[str, Theme]] = {}
+
 
-def load_themes() -> dict[str, Theme]:
+def load_themes(config: Optional[Dict[str, Any]] = None) -> dict[str, Theme]:
     """Load themes from default and user config."""
-    config = load_config()
+    if config is None:
+        config = load_config()
     user_theme_defs = config.get("themes", {})
+    key = json.dumps(user_theme_defs, sort_keys=True)
+    if key in _themes_cache:
+        return dict(_themes_cache[key])
+
+    # Imported here so modules that only need settings don't build themes.
+    from textual.theme import Theme
+    from .default_themes import DEFAULT_THEMES
 
     # Start with default themes
     themes = DEFAULT_THEMES.copy()
@@ -149,15 +207,16 @@ def load_themes() -> dict[str, Theme]:
     # Create Theme objects from user definitions and merge them
     for name, definition in user_theme_defs.items():
         try:
-            # Add the 'name' to the definition dict before creating the Theme
-            definition['name'] = name
-            themes[name] = Theme.from_dict(definition)
+            # Add the 'name' to a copy of the definition; the config dict may
+            # be shared with the caller.
+            themes[name] = Theme(**{**definition, "name": name})
         except Exception as e:
             # Ignore invalid theme definitions
             logger.warning("Ignoring invalid theme definition for '%s': %s", name, e)
             pass
 
-    return themes
+    _themes_cache[key] = themes
+    return dict(themes)
 
 
 def load_theme_name_from_config() -> Optional[str]:
@@ -170,13 +229,14 @@ def ensure_themes_are_copied() -> None:
     """Copy built-in themes to the user's config directory."""
     themes_dir = os.path.join(os.path.dirname(CONFIG_PATH), "themes")
     os.makedirs(themes_dir, exist_ok=True)
+    existing = set(os.listdir(themes_dir))
 
     try:
         theme_files = importlib.resources.files("news_tui.packaged_themes")
         for theme_file in theme_files.iterdir():
             if theme_file.is_file() and theme_file.name.endswith(".css"):
-                dest_path = os.path.join(themes_dir, theme_file.name)
-                if not os.path.exists(dest_path):
+                if theme_file.name not in existing:
+                    dest_path = os.path.join(themes_dir, theme_file.name)
                     with importlib.resources.as_file(theme_file) as theme_file_path:
                         shutil.copy(theme_file_path, dest_path)
                         logger.info(f"Copied theme '{theme_file.name}' to '{dest_path}'")
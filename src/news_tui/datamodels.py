@@ -18,3 +18,12 @@ class Story:
 class Section:
     title: str
     url: str
+
+
+@dataclass
+class StoryContent:
+    # Declared by hand; dataclass(slots=True) needs Python 3.10.
+    __slots__ = ("ok", "content")
+
+    ok: bool
+    content: str
@@ -20,7 +20,8 @@ def main() -> None:
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
     # Load themes to populate help text
-    available_themes = load_themes()
+    config = load_config()
+    available_themes = load_themes(config)
     parser.add_argument(
         "--theme",
         type=str,
@@ -32,7 +33,6 @@ def main() -> None:
     if debug_path:
         print(f"Debug logging enabled: {debug_path}", file=sys.stderr)
 
-    config = load_config()
     theme_name = args.theme or config.get("theme") or "dracula"
 
     if theme_name not in available_themes:
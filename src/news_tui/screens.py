@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import webbrowser
+import re
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
-from textual.message import Message
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.worker import Worker, WorkerState
 from textual.widgets import (
     Button,
@@ -28,24 +28,17 @@ from textual.widgets import (
 import os
 from .config import (
     CONFIG_PATH,
+    HOME_PAGE_URL,
     load_bookmarks,
     save_bookmarks,
     save_config,
     logger,
-    load_themes,
 )
 from .datamodels import Section, Story
 from .sources.base import Source
 from .widgets import SectionCheckbox, StatusBar
 
-# Markdown & scroll fallbacks for different Textual versions
-MarkdownWidget = Markdown
-
-try:
-    from textual.containers import VerticalScroll  # some versions
-except Exception:
-    # fallback to Vertical for containing article content if VerticalScroll is missing
-    VerticalScroll = Vertical  # type: ignore
+_WORD_RE = re.compile(r"\S+")
 
 
 # --- Story screen (separate) ---
@@ -62,106 +55,103 @@ class StoryViewScreen(Screen):
         super().__init__()
         self.story = story
         self.source = source
+        self._reload_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
-        # loading indicator and scrollable Markdown
-        loading = LoadingIndicator(id="story-loading")
-        yield loading
-        yield VerticalScroll(
-            MarkdownWidget("", id="story-markdown"),
-            id="story-scroll",
-        )
-        yield StatusBar()
+        # loading indicator and scrollable Markdown; keep handles to them
+        self._loading = LoadingIndicator(id="story-loading")
+        self._md = Markdown("", id="story-markdown")
+        self._scroll = VerticalScroll(self._md, id="story-scroll")
+        self._status = StatusBar()
+        yield self._loading
+        yield self._scroll
+        yield self._status
 
     def on_mount(self) -> None:
         self.title = self.story.title
         # hide loading until the worker runs
-        try:
-            self.query_one("#story-loading", LoadingIndicator).display = False
-        except Exception:
-            pass
-        self.query_one("#story-scroll").focus()
+        self._loading.display = False
+        self._scroll.focus()
         self.load_story()
         self.app.apply_theme_styles(self)
 
-        keybinding_style = self.app.get_keybinding_style()
-        self.query_one(StatusBar).set_keybindings(
-            f"[b {keybinding_style}]up/down[/] to scroll, [b {keybinding_style}]o[/] to open"
+        self._status.set_keybindings(
+            "[b {color}]up/down[/] to scroll, [b {color}]o[/] to open"
         )
 
+    def _toggle_loading(self, loading: bool) -> None:
+        with self.app.batch_update():
+            self._loading.display = loading
+            self._scroll.display = not loading
+
     def load_story(self) -> None:
-        try:
-            self.query_one("#story-loading", LoadingIndicator).display = True
-            self.query_one("#story-scroll").display = False
-        except Exception:
-            pass
-        # fetch in worker thread
+        self._toggle_loading(True)
+        # fetch in worker thread, superseding any load still in flight
         self.run_worker(
-            lambda: self.source.get_story_content(self.story),
+            lambda: self.source.get_story_content_cached(self.story),
             name="story_loader",
+            group="story_loader",
             thread=True,
+            exclusive=True,
+            exit_on_error=False,
         )
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
-        if getattr(event.worker, "name", None) != "story_loader":
+        if event.worker.group != "story_loader":
+            return
+        # A cancelled load has been replaced by a newer one.
+        if event.state in (
+            WorkerState.PENDING,
+            WorkerState.RUNNING,
+            WorkerState.CANCELLED,
+        ):
             return
 
-        # Only act when worker finished (SUCCESS) or otherwise finished (non-running).
-        if event.state is WorkerState.SUCCESS:
-            result = getattr(event.worker, "result", None) or {
-                "ok": False,
-                "content": "No content",
-            }
-            try:
-                self.query_one("#story-loading", LoadingIndicator).display = False
-                self.query_one("#story-scroll").display = True
-            except Exception:
-                pass
-            md = self.query_one("#story-markdown")
-            if isinstance(result, dict) and result.get("ok"):
-                content = result.get("content", "")
+        md = self._md
+        # One compositor pass for the display toggles and content update.
+        with self.app.batch_update():
+            self._toggle_loading(False)
+            result = event.worker.result
+            if event.state is WorkerState.SUCCESS and result is not None and result.ok:
+                md.remove_class("error")
+                content = result.content
                 md.update(content)
-                word_count = len(content.split())
+                word_count = sum(1 for _ in _WORD_RE.finditer(content))
                 time_to_read = max(1, round(word_count / 200))
                 self.sub_title = f"~{time_to_read} min read"
+                return
+
+            md.add_class("error")
+            if event.state is WorkerState.SUCCESS:
+                message = result.content if result is not None else ""
+                md.update(f"**{message or 'Unable to load article.'}**")
+                return
+
+            # worker failed without a result
+            error = event.worker.error
+            if error:
+                logger.error("Story loader worker failed: %s", error)
+                md.update(f"**Unable to load article: {error}**")
             else:
-                msg = (
-                    result.get("content", "Unable to load article.")
-                    if isinstance(result, dict)
-                    else "Unable to load article."
-                )
-                md.styles.color = "$error"
-                md.update(f"[b]{msg}[/b]")
-        else:
-            # worker not SUCCESS; if it's not running/pending treat as failure
-            if event.state not in (WorkerState.PENDING, WorkerState.RUNNING):
-                try:
-                    self.query_one("#story-loading", LoadingIndicator).display = False
-                    self.query_one("#story-scroll").display = True
-                    md = self.query_one("#story-markdown")
-                    md.styles.color = "$error"
-                    error = getattr(event.worker, "error", None)
-                    if error:
-                        logger.error("Story loader worker failed: %s", error)
-                        md.update(f"[b]Unable to load article: {error}[/b]")
-                    else:
-                        logger.error("Story loader worker failed with no specific error.")
-                        md.update("[b]Unable to load article[/b]")
-                except Exception:
-                    pass
+                logger.error("Story loader worker failed with no specific error.")
+                md.update("**Unable to load article**")
 
     def action_open_in_browser(self) -> None:
-        webbrowser.open(self.story.url)
+        self.app.open_url(self.story.url)
 
     def action_reload_story(self) -> None:
-        self.load_story()
+        self.source.invalidate_story(self.story.url)
+        # Coalesce repeated presses into a single reload.
+        if self._reload_timer is not None:
+            self._reload_timer.stop()
+        self._reload_timer = self.set_timer(0.05, self.load_story)
 
     def action_scroll_down(self) -> None:
-        self.query_one("#story-scroll").scroll_down()
+        self._scroll.scroll_down()
 
     def action_scroll_up(self) -> None:
-        self.query_one("#story-scroll").scroll_up()
+        self._scroll.scroll_up()
 
 
 class ErrorScreen(Screen):
@@ -197,8 +187,11 @@ class BookmarksScreen(Screen):
         table = self.query_one(DataTable)
         table.cursor_type = "row"
         table.add_column("Title", key="title")
-        for bookmark in self.bookmarks:
-            table.add_row(bookmark["title"], key=bookmark["url"])
+        # add_rows() cannot take row keys, which deletion relies on, so add
+        # the rows one by one inside a single batch instead.
+        with self.app.batch_update():
+            for bookmark in self.bookmarks:
+                table.add_row(bookmark["title"], key=bookmark["url"])
         self.app.apply_theme_styles(self)
 
     def action_delete_bookmark(self) -> None:
@@ -229,30 +222,29 @@ class SettingsScreen(Screen):
         Binding("escape,q", "app.pop_screen", "Back"),
     ]
 
-    class SectionsLoaded(Message):
-        def __init__(self, sections: list[Section]):
-            self.sections = sections
-            super().__init__()
+    def __init__(self) -> None:
+        super().__init__()
+        self._meta_list: ListView | None = None
+        self._meta_tab_built = False
+        self._loaded_sections: list[Section] | None = None
+        self._section_checkboxes: list[SectionCheckbox] = []
+        self._meta_checkboxes: list[SectionCheckbox] = []
 
     def compose(self) -> ComposeResult:
         yield Header()
         yield Footer()
         with TabbedContent(id="settings-tabs"):
             with TabPane("Sections", id="sections-tab"):
-                yield ListView(id="sections-list")
-            with TabPane("Meta Sections", id="meta-sections-tab"):
-                with Vertical():
-                    yield Label("Meta Section Name", classes="settings-label")
-                    yield Input(placeholder="e.g. My Awesome Feed", id="meta-section-name")
-                    yield Label("Constituent Sections", classes="settings-label")
-                    yield ListView(id="meta-sections-constituents")
-                    yield Button(
-                        "Create Meta Section",
-                        id="create-meta-section",
-                        classes="settings-button",
-                    )
+                self._sections_list = ListView(id="sections-list")
+                yield self._sections_list
+            # Contents are built on demand, see _ensure_meta_tab.
+            yield TabPane("Meta Sections", id="meta-sections-tab")
             with TabPane("Theme", id="theme-tab"):
-                yield Select([], id="theme-select", prompt="Select a theme")
+                yield Select(
+                    [(theme, theme) for theme in self.app.theme_names],
+                    id="theme-select",
+                    prompt="Select a theme",
+                )
             with TabPane("Layout", id="layout-tab"):
                 yield Select(
                     [("Default", "default"), ("Compact", "compact")],
@@ -264,13 +256,16 @@ class SettingsScreen(Screen):
     def on_mount(self) -> None:
         """Load sections and populate lists."""
         self.title = "Settings"
-        self.run_worker(self.load_sections, name="load_settings_sections", thread=True)
+        self.run_worker(
+            self.app.source.get_sections_cached,
+            name="load_settings_sections",
+            group="settings_sections",
+            thread=True,
+        )
 
         # Set theme selector
         theme_select = self.query_one("#theme-select", Select)
-        themes = load_themes()
-        theme_select.set_options([(theme, theme) for theme in themes.keys()])
-        if self.app.theme_name in themes:
+        if self.app.theme_name in self.app.themes:
             theme_select.value = self.app.theme_name
         else:
             theme_select.clear()
@@ -280,43 +275,81 @@ class SettingsScreen(Screen):
         layout_select.value = self.app.config.get("layout", "default")
         self.app.apply_theme_styles(self)
 
+    async def _ensure_meta_tab(self) -> None:
+        """Build the Meta Sections tab the first time it is opened."""
+        if self._meta_tab_built:
+            return
+        self._meta_tab_built = True
+        meta_list = ListView(id="meta-sections-constituents")
+        pane = self.query_one("#meta-sections-tab", TabPane)
+        await pane.mount(
+            Vertical(
+                Label("Meta Section Name", classes="settings-label"),
+                Input(placeholder="e.g. My Awesome Feed", id="meta-section-name"),
+                Label("Constituent Sections", classes="settings-label"),
+                meta_list,
+                Button(
+                    "Create Meta Section",
+                    id="create-meta-section",
+                    classes="settings-button",
+                ),
+            )
+        )
+        # Only expose the list once it is mounted: sections that load before
+        # this point are added here, later ones by _handle_sections_loaded.
+        self._meta_list = meta_list
+        if self._loaded_sections is not None:
+            self._populate_meta_constituents(self._loaded_sections)
+
+    def _populate_meta_constituents(self, sections: list[Section]) -> None:
+        items = []
+        for section in sections:
+            cb_meta = SectionCheckbox(section.title, False, section=section)
+            self._meta_checkboxes.append(cb_meta)
+            items.append(ListItem(cb_meta))
+        self._meta_list.extend(items)
+
+    async def on_tabbed_content_tab_activated(
+        self, event: TabbedContent.TabActivated
+    ) -> None:
+        if event.pane.id == "meta-sections-tab":
+            await self._ensure_meta_tab()
+
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "meta-section-name":
-            constituents_list = self.query_one("#meta-sections-constituents", ListView)
-            if event.value:
-                constituents_list.add_class("highlight-list")
-            else:
-                constituents_list.remove_class("highlight-list")
+            self._meta_list.set_class(bool(event.value), "highlight-list")
 
     def on_select_changed(self, event: Select.Changed) -> None:
         if event.select.id == "theme-select":
             self.app.theme = event.value
 
-    def load_sections(self) -> None:
-        """Load sections in a worker."""
-        all_sections = self.app.source.get_sections()
-        self.post_message(self.SectionsLoaded(all_sections))
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        if (
+            event.worker.group == "settings_sections"
+            and event.state is WorkerState.SUCCESS
+        ):
+            self._handle_sections_loaded(event.worker.result)
 
-    def on_settings_screen_sections_loaded(
-        self, message: SettingsScreen.SectionsLoaded
-    ) -> None:
-        sections_list = self.query_one("#sections-list", ListView)
-        meta_constituents_list = self.query_one("#meta-sections-constituents", ListView)
+    def _handle_sections_loaded(self, sections: list[Section]) -> None:
+        sections = sections or [Section("Home", HOME_PAGE_URL)]
+        self._loaded_sections = sections
 
-        enabled_sections = self.app.config.get("sections", [])
+        enabled_sections = set(self.app.config.get("sections", []))
         if not enabled_sections:  # if not configured, enable all by default
-            enabled_sections = [s.title for s in message.sections]
+            enabled_sections = {s.title for s in sections}
 
-        for section in message.sections:
+        items = []
+        for section in sections:
             is_enabled = section.title in enabled_sections
             cb = SectionCheckbox(section.title, is_enabled, section=section)
-            item = ListItem(cb)
-            sections_list.append(item)
+            self._section_checkboxes.append(cb)
+            items.append(ListItem(cb))
 
-            # also populate the list for meta sections
-            cb_meta = SectionCheckbox(section.title, False, section=section)
-            item_meta = ListItem(cb_meta)
-            meta_constituents_list.append(item_meta)
+        with self.app.batch_update():
+            self._sections_list.extend(items)
+            # The meta constituents are only built once that tab has been opened.
+            if self._meta_list is not None:
+                self._populate_meta_constituents(sections)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "save-settings":
@@ -326,12 +359,9 @@ class SettingsScreen(Screen):
 
     def save_settings(self) -> None:
         # Get selected sections
-        sections_list = self.query_one("#sections-list", ListView)
-        enabled_sections = []
-        for item in sections_list.children:
-            checkbox = item.query_one(SectionCheckbox)
-            if checkbox.value:
-                enabled_sections.append(checkbox.section.title)
+        enabled_sections = [
+            cb.section.title for cb in self._section_checkboxes if cb.value
+        ]
 
         # Get selected theme
         theme_select = self.query_one("#theme-select", Select)
@@ -367,12 +397,9 @@ class SettingsScreen(Screen):
             self.app.notify("Meta section name cannot be empty.", severity="error")
             return
 
-        constituents_list = self.query_one("#meta-sections-constituents", ListView)
-        selected_sections = []
-        for item in constituents_list.children:
-            checkbox = item.query_one(SectionCheckbox)
-            if checkbox.value:
-                selected_sections.append(checkbox.section.title)
+        selected_sections = [
+            cb.section.title for cb in self._meta_checkboxes if cb.value
+        ]
 
         if not selected_sections:
             self.app.notify(
@@ -387,5 +414,5 @@ class SettingsScreen(Screen):
         save_config(config)
         self.app.notify(f"Meta section '{meta_section_name}' created.")
         meta_section_name_input.value = ""
-        for checkbox in constituents_list.query(SectionCheckbox):
+        for checkbox in self._meta_checkboxes:
             checkbox.value = False
@@ -1,28 +1,133 @@
 from __future__ import annotations
 
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
-from ..datamodels import Section, Story
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config import (
+    FETCH_CONCURRENCY,
+    HTTP_POOL_SIZE,
+    REQUEST_HEADERS,
+    SECTIONS_CACHE_TTL,
+    STORIES_CACHE_TTL,
+    STORY_CACHE_SIZE,
+)
+from ..datamodels import Section, Story, StoryContent
+
+
+def create_session() -> requests.Session:
+    """Create an HTTP session with retries and a connection pool sized for workers."""
+    s = requests.Session()
+    s.headers.update(REQUEST_HEADERS)
+    # Responses are read whole, so buffer them as they arrive.
+    s.stream = False
+    retries = Retry(
+        total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(
+        max_retries=retries,
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        pool_block=False,
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
 
 
 class Source(ABC):
     """Abstract base class for a news source."""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(
+        self, config: Dict[str, Any], session: Optional[requests.Session] = None
+    ):
         self.config = config
+        self.session = session if session is not None else create_session()
+        self._sections_cache: Optional[Tuple[float, List[Section]]] = None
+        self._stories_cache: Dict[str, Tuple[float, List[Story]]] = {}
+        # Recently loaded story content by URL, oldest first. Stories are
+        # fetched from worker threads, hence the lock.
+        self._story_cache: OrderedDict[str, StoryContent] = OrderedDict()
+        self._story_cache_lock = threading.Lock()
 
     @abstractmethod
     def get_sections(self) -> List[Section]:
-        """Return a list of available sections."""
+        """Return a list of available sections, or an empty list if none could be fetched."""
         pass
 
+    def get_sections_cached(self, ttl: float = SECTIONS_CACHE_TTL) -> List[Section]:
+        """Return the sections, reusing a result fetched less than ttl seconds ago."""
+        now = time.monotonic()
+        if self._sections_cache and now - self._sections_cache[0] < ttl:
+            return list(self._sections_cache[1])
+        sections = self.get_sections()
+        if sections:
+            self._sections_cache = (now, sections)
+        return list(sections)
+
     @abstractmethod
     def get_stories(self, section: Section) -> List[Story]:
         """Return a list of stories for a given section."""
         pass
 
+    def get_stories_cached(
+        self, section: Section, ttl: float = STORIES_CACHE_TTL
+    ) -> List[Story]:
+        """Return a section's stories, reusing a listing fetched less than ttl seconds ago."""
+        now = time.monotonic()
+        cached = self._stories_cache.get(section.url)
+        if cached and now - cached[0] < ttl:
+            return list(cached[1])
+        stories = self.get_stories(section)
+        if stories:
+            self._stories_cache[section.url] = (now, stories)
+        return list(stories)
+
+    def get_stories_batch(self, sections: List[Section]) -> Dict[str, List[Story]]:
+        """Fetch the stories for several sections concurrently, keyed by section URL."""
+        if not sections:
+            return {}
+        workers = min(FETCH_CONCURRENCY, len(sections))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.get_stories_cached, sections)
+            return {section.url: stories for section, stories in zip(sections, results)}
+
+    def clear_sections_cache(self) -> None:
+        """Forget the cached section list."""
+        self._sections_cache = None
+
+    def clear_stories_cache(self) -> None:
+        """Forget all cached story listings."""
+        self._stories_cache.clear()
+
     @abstractmethod
-    def get_story_content(self, story: Story) -> Dict[str, Any]:
+    def get_story_content(self, story: Story) -> StoryContent:
         """Return the content of a story."""
         pass
+
+    def get_story_content_cached(self, story: Story) -> StoryContent:
+        """Return the content of a story, reusing recently loaded articles."""
+        with self._story_cache_lock:
+            cached = self._story_cache.get(story.url)
+            if cached is not None:
+                self._story_cache.move_to_end(story.url)
+                return cached
+        content = self.get_story_content(story)
+        if content.ok:
+            with self._story_cache_lock:
+                self._story_cache[story.url] = content
+                while len(self._story_cache) > STORY_CACHE_SIZE:
+                    self._story_cache.popitem(last=False)
+        return content
+
+    def invalidate_story(self, url: str) -> None:
+        """Forget any cached content for the story at url."""
+        with self._story_cache_lock:
+            self._story_cache.pop(url, None)
@@ -3,47 +3,107 @@ from __future__ import annotations
 import html
 import json
 import logging
+import re
+import sys
+import threading
 import time
-from typing import Any, Dict, Iterable, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from lxml import etree
 
 from ..config import (
     DOMAIN_BASE,
     HOME_PAGE_URL,
+    HTTP_CACHE_SIZE,
     HTTP_TIMEOUT,
     INITIAL_RETRY_DELAY,
     MIN_ARTICLE_WORDS,
     PLACEHOLDER_PATTERN,
-    REQUEST_HEADERS,
     RETRY_ATTEMPTS,
     SECTIONS_PAGE_URL,
 )
-from ..datamodels import Section, Story
+from ..datamodels import Section, Story, StoryContent
 from .base import Source
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    # selectolax is optional; lxml is used when it isn't installed.
+    LexborHTMLParser = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger("news")
 
+_SECTIONS_SELECTOR = "nav a[href], a[href^='/lite']"
+_STORIES_SELECTOR = "a[href*='/lite/story/']"
+_SCHEME_RE = re.compile(r"^https?://")
+_WORD_RE = re.compile(r"\S+")
+_URLJOIN_NEEDED_RE = re.compile(r"/\.|;|\?#|[\t\r\n]")
+_NEXT_DATA_RE = re.compile(
+    rb"<script[^>]*\bid=[\"']?__NEXT_DATA__[\"']?[^>]*>(.*?)</script>", re.DOTALL
+)
+
+# XPath equivalents of the CSS selectors above for the lxml fallback.
+_SECTIONS_XPATH = etree.XPath("//nav//a[@href] | //a[starts-with(@href, '/lite')]")
+_STORIES_XPATH = etree.XPath("//a[contains(@href, '/lite/story/')]")
+# A <meta charset> must appear within the first 1024 bytes of a page.
+_META_CHARSET_RE = re.compile(rb"<meta[^>]+charset", re.I)
+
+# lxml parsers keep their setup between documents but must not be shared
+# across threads, and pages are fetched from worker threads.
+_parser_local = threading.local()
+
 
 class CBCSource(Source):
-    def __init__(self, config: Dict[str, Any]):
-        super().__init__(config)
-        self.session = self._create_session()
-
-    def _create_session(self) -> requests.Session:
-        s = requests.Session()
-        s.headers.update(REQUEST_HEADERS)
-        retries = Retry(
-            total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]
+    def __init__(
+        self, config: Dict[str, Any], session: Optional[requests.Session] = None
+    ):
+        super().__init__(config, session)
+        # Validators and bodies of recent responses by URL, oldest first, so
+        # repeat fetches can be conditional requests answered with a 304.
+        self._http_cache: OrderedDict[str, Tuple[Dict[str, str], bytes]] = (
+            OrderedDict()
         )
-        adapter = HTTPAdapter(max_retries=retries)
-        s.mount("https://", adapter)
-        s.mount("http://", adapter)
-        return s
+        self._http_cache_lock = threading.Lock()
+        # Stories last parsed for each section, with the page body they came
+        # from. A 304 hands back that same body object, so it isn't re-parsed.
+        self._parsed_listings: Dict[Tuple[str, str], Tuple[bytes, List[Story]]] = {}
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        with self._http_cache_lock:
+            cached = self._http_cache.get(url)
+        return dict(cached[0]) if cached else {}
+
+    def _remember_response(self, url: str, resp: requests.Response) -> None:
+        validators = {}
+        if etag := resp.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := resp.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        with self._http_cache_lock:
+            if not validators:
+                self._http_cache.pop(url, None)
+                return
+            self._http_cache[url] = (validators, resp.content)
+            self._http_cache.move_to_end(url)
+            while len(self._http_cache) > HTTP_CACHE_SIZE:
+                self._http_cache.popitem(last=False)
+
+    def _cached_body(self, url: str) -> Optional[bytes]:
+        with self._http_cache_lock:
+            cached = self._http_cache.get(url)
+            if cached is None:
+                return None
+            self._http_cache.move_to_end(url)
+            return cached[1]
 
     def _retryable_fetch(
         self, url: str, timeout: int = HTTP_TIMEOUT, attempts: int = RETRY_ATTEMPTS
@@ -52,9 +112,19 @@ class CBCSource(Source):
         for attempt in range(1, attempts + 1):
             try:
                 logger.debug("Fetching %s (attempt %d/%d)", url, attempt, attempts)
-                resp = self.session.get(url, timeout=timeout)
+                resp = self.session.get(
+                    url, timeout=timeout, headers=self._conditional_headers(url)
+                )
+                if resp.status_code == 304:
+                    body = self._cached_body(url)
+                    if body is None:
+                        # Evicted since the request was sent; retry in full.
+                        raise requests.RequestException("304 without cached body")
+                    logger.debug("%s not modified, using cached body", url)
+                    return body
                 resp.raise_for_status()
                 logger.debug("Fetched %s OK", url)
+                self._remember_response(url, resp)
                 return resp.content
             except requests.RequestException as e:
                 logger.debug("Fetch attempt %d failed for %s: %s", attempt, url, e)
@@ -67,16 +137,21 @@ class CBCSource(Source):
 
     def get_sections(self) -> List[Section]:
         sections_map: Dict[str, Section] = {}
-        for url in (HOME_PAGE_URL, SECTIONS_PAGE_URL):
-            content = self._retryable_fetch(url)
+        urls = (HOME_PAGE_URL, SECTIONS_PAGE_URL)
+        # Fetch both pages at once, but merge them in order so the home page
+        # navigation always comes first.
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            pages = list(executor.map(self._retryable_fetch, urls))
+        if not any(pages):
+            # Nothing was fetched; let callers fall back rather than cache Home.
+            return []
+        for url, content in zip(urls, pages):
             if not content:
                 continue
             try:
-                soup = BeautifulSoup(content, "lxml")
-                for a in soup.select("nav a[href], a[href^='/lite']"):
-                    href = _abs_url(a.get("href", ""))
+                for href, title in _section_links(content):
+                    href = _abs_url(href)
                     if "/lite" in href and "/lite/story/" not in href:
-                        title = a.get_text(strip=True)
                         if (
                             title
                             and title.lower() not in {"menu", "search"}
@@ -91,18 +166,23 @@ class CBCSource(Source):
         content = self._retryable_fetch(section.url)
         if not content:
             return []
+        key = (section.url, section.title)
+        parsed = self._parsed_listings.get(key)
+        if parsed and parsed[0] is content:
+            return list(parsed[1])
         try:
-            soup = BeautifulSoup(content, "lxml")
             stories: List[Story] = []
-            for a in soup.select("a[href*='/lite/story/']"):
-                href = _abs_url(a.get("href", ""))
-                span = a.find("span")
-                flag = span.get_text(strip=True) if span else None
-                title = a.get_text(" ", strip=True).replace(flag or "", "").strip()
-                summary = None
-                if p := a.find_next_sibling("p"):
-                    summary = p.get_text(strip=True)
+            seen: set[str] = set()
+            for href, flag, title, summary in _story_links(content):
+                href = _abs_url(href)
+                if href in seen:
+                    continue
                 if title and href:
+                    seen.add(href)
+                    # Flags come from a handful of labels ("New", "Live", ...);
+                    # share one string per label across every listing.
+                    if flag:
+                        flag = sys.intern(flag)
                     stories.append(
                         Story(
                             title=title,
@@ -112,104 +192,259 @@ class CBCSource(Source):
                             summary=summary,
                         )
                     )
-            return _unique_ordered_stories(stories)
+            self._parsed_listings[key] = (content, stories)
+            return list(stories)
         except Exception as e:
             logger.error("Failed to parse stories from %s: %s", section.url, e)
             return []
 
-    def get_story_content(self, story: Story) -> Dict[str, Any]:
+    def get_story_content(self, story: Story) -> StoryContent:
         content_bytes = self._retryable_fetch(story.url)
         if not content_bytes:
-            return {"ok": False, "content": "Failed to fetch article."}
+            return StoryContent(False, "Failed to fetch article.")
         try:
-            soup = BeautifulSoup(content_bytes, "lxml")
-            json_script = soup.find("script", id="__NEXT_DATA__")
-            if json_script and getattr(json_script, "string", None):
-                try:
-                    data = json.loads(json_script.string)
-                    article = (
-                        data.get("props", {})
-                        .get("pageProps", {})
-                        .get("articleData", {})
-                    )
-                    parts = [f"# {article.get('title', 'No Title')}\n\n"]
-                    for node in article.get("body", {}).get("parsed", []):
-                        parts.append(_parse_json_node_to_markdown(node))
-                    if more := article.get("moreStories", []):
-                        parts.append("\n\n---\n\n## More Stories\n\n")
-                        parts.extend(
-                            f"- [{s.get('title')}]({_abs_url(s.get('url'))})\n"
-                            for s in more
-                        )
-                    full = html.unescape("".join(parts)).strip()
-                    if len(full.split()) > MIN_ARTICLE_WORDS:
-                        return {"ok": True, "content": full}
-                except Exception:
-                    logger.debug(
-                        "JSON parse failed for %s; falling back to paragraphs",
-                        story.url,
-                    )
-            main = soup.find("main") or soup
-            paras = [p.get_text(" ", strip=True) for p in main.find_all("p")]
+            # Most articles embed their body as JSON; pull it out with a regex
+            # and only build a DOM when it is missing or too short.
+            match = _NEXT_DATA_RE.search(content_bytes)
+            if match and (full := _next_data_to_markdown(match.group(1), story.url)):
+                return StoryContent(True, full)
+            next_data, paras = _article_parts(content_bytes)
+            if match is None and (full := _next_data_to_markdown(next_data, story.url)):
+                return StoryContent(True, full)
             candidate = "\n\n".join([p for p in paras if p]).strip()
             if candidate and not _is_placeholder_text(candidate):
-                return {"ok": True, "content": candidate}
+                return StoryContent(True, candidate)
         except Exception as e:
             logger.error("Failed to parse story content from %s: %s", story.url, e)
-        return {"ok": False, "content": "Could not extract valid article content."}
+        return StoryContent(False, "Could not extract valid article content.")
+
+
+def _next_data_to_markdown(next_data: Optional[str | bytes], url: str) -> Optional[str]:
+    """Render a ``__NEXT_DATA__`` payload as Markdown, or None if it is unusable."""
+    if not next_data:
+        return None
+    try:
+        data = _json_loads(next_data)
+        article = data.get("props", {}).get("pageProps", {}).get("articleData", {})
+        # Entities are decoded as each piece is written, so the finished
+        # article is joined once and never rescanned.
+        out = [f"# {html.unescape(article.get('title', 'No Title'))}\n\n"]
+        _write_markdown(article.get("body", {}).get("parsed", []), out)
+        if more := article.get("moreStories", []):
+            out.append("\n\n---\n\n## More Stories\n\n")
+            out.extend(
+                f"- [{html.unescape(str(s.get('title')))}]"
+                f"({html.unescape(_abs_url(s.get('url')))})\n"
+                for s in more
+            )
+        full = "".join(out).strip()
+    except Exception:
+        logger.debug("JSON parse failed for %s; falling back to paragraphs", url)
+        return None
+    if _more_than_n_words(full, MIN_ARTICLE_WORDS):
+        return full
+    return None
+
+
+def _section_links(content: bytes) -> Iterator[Tuple[str, str]]:
+    """Yield ``(href, title)`` for every candidate section link."""
+    if LexborHTMLParser is not None:
+        for a in LexborHTMLParser(content).css(_SECTIONS_SELECTOR):
+            yield a.attributes.get("href") or "", _text(a)
+        return
+    root = _parse_html(content)
+    if root is None:
+        return
+    for a in _SECTIONS_XPATH(root):
+        yield a.get("href", ""), _text(a)
+
+
+def _story_links(
+    content: bytes,
+) -> Iterator[Tuple[str, Optional[str], str, Optional[str]]]:
+    """Yield ``(href, flag, title, summary)`` for every story link.
+
+    The flag is the text of the link's first ``<span>``; that element is
+    dropped from the tree so the title is read in a single pass.
+    """
+    if LexborHTMLParser is not None:
+        for a in LexborHTMLParser(content).css(_STORIES_SELECTOR):
+            span = a.css_first("span")
+            flag = None
+            if span:
+                flag = _text(span)
+                span.decompose()
+            # Equivalent of lxml's next(a.itersiblings("p")).
+            sibling = a.next
+            while sibling is not None and sibling.tag != "p":
+                sibling = sibling.next
+            summary = _text(sibling) if sibling is not None else None
+            title = _text(a, " ")
+            yield a.attributes.get("href") or "", flag, title, summary
+        return
+    root = _parse_html(content)
+    if root is None:
+        return
+    for a in _STORIES_XPATH(root):
+        span = next(a.iter("span"), None)
+        flag = None
+        if span is not None:
+            flag = _text(span)
+            _empty_element(span)
+        summary = None
+        if (p := next(a.itersiblings("p"), None)) is not None:
+            summary = _text(p)
+        title = _text(a, " ")
+        yield a.get("href", ""), flag, title, summary
+
+
+def _article_parts(content: bytes) -> Tuple[Optional[str], List[str]]:
+    """Return the ``__NEXT_DATA__`` JSON text and the article paragraphs."""
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(content)
+        script = tree.css_first("script#__NEXT_DATA__")
+        next_data = script.text(deep=False) if script else None
+        main = tree.css_first("main") or tree
+        paras = [_text(p, " ") for p in main.css("p")]
+        return next_data, paras
+    root = _parse_html(content)
+    if root is None:
+        return None, []
+    script = root.find(".//script[@id='__NEXT_DATA__']")
+    next_data = script.text if script is not None else None
+    main = root.find(".//main")
+    if main is None:
+        main = root
+    paras = [_text(p, " ") for p in main.iter("p")]
+    return next_data, paras
+
+
+def _parse_html(content: bytes) -> Optional[etree._Element]:
+    """Parse a page with this thread's lxml parser; None if it is empty.
+
+    lxml decodes pages that declare a charset itself; undeclared ones are
+    read as UTF-8 rather than libxml2's Latin-1 default.
+    """
+    if _META_CHARSET_RE.search(content, 0, 1024):
+        name, encoding = "parser", None
+    else:
+        name, encoding = "utf8_parser", "utf-8"
+    parser = getattr(_parser_local, name, None)
+    if parser is None:
+        parser = etree.HTMLParser(encoding=encoding)
+        setattr(_parser_local, name, parser)
+    return etree.fromstring(content, parser)
+
+
+def _text(el: Any, separator: str = "") -> str:
+    """Join the stripped, non-empty text pieces under an lxml or Lexbor node.
+
+    Both backends go through here so they produce the same titles and
+    paragraphs for a page.
+    """
+    if isinstance(el, etree._Element):
+        pieces = el.itertext()
+    else:
+        pieces = (
+            n.text_content for n in el.traverse(include_text=True) if n.tag == "-text"
+        )
+    return separator.join(t for t in map(str.strip, pieces) if t)
+
+
+def _empty_element(el: etree._Element) -> None:
+    """Drop an element's contents but keep the text that follows it."""
+    tail = el.tail
+    el.clear()
+    el.tail = tail
 
 
 def _abs_url(href: str) -> str:
     if not href:
         return ""
-    if href.startswith("http://") or href.startswith("https://"):
+    # Most links are plain root-relative paths; join those by hand and leave
+    # urljoin for anything it would normalise (dot segments, ";" params,
+    # empty queries or fragments, protocol-relative hosts).
+    if (
+        href[0] == "/"
+        and href[1:2] != "/"
+        and href[-1] not in "?#"
+        and not _URLJOIN_NEEDED_RE.search(href)
+    ):
+        return DOMAIN_BASE + href
+    if _SCHEME_RE.match(href):
         return href
     return urljoin(DOMAIN_BASE, href)
 
 
-def _unique_ordered_stories(items: Iterable[Story]) -> List[Story]:
-    seen = set()
-    out: List[Story] = []
-    for s in items:
-        if s.url and s.url not in seen:
-            seen.add(s.url)
-            out.append(s)
-    return out
+def _more_than_n_words(text: str, n: int) -> bool:
+    """Return whether text has more than n words, stopping once it does."""
+    if n < 0:
+        return True
+    count = 0
+    for _ in _WORD_RE.finditer(text):
+        count += 1
+        if count > n:
+            return True
+    return False
 
 
 def _is_placeholder_text(text: str) -> bool:
     if not text:
         return True
-    if len(text.split()) < MIN_ARTICLE_WORDS:
+    if not _more_than_n_words(text, MIN_ARTICLE_WORDS - 1):
         return True
     if PLACEHOLDER_PATTERN.search(text):
         return True
     return False
 
 
-def _parse_json_node_to_markdown(node: Dict[str, Any]) -> str:
-    if not isinstance(node, dict):
-        return ""
-    node_type = node.get("type")
+def _write_markdown(nodes: List[Any], out: List[str]) -> None:
+    # Iterative post-order walk: each tag node is visited once on the way
+    # down to queue its children and once on the way up to wrap their
+    # rendered output, which is collected on the caller's ``out`` buffer.
+    stack: List[Tuple[Any, int]] = [(node, -1) for node in reversed(nodes)]
+    while stack:
+        current, mark = stack.pop()
+        if mark >= 0:
+            child_content = "".join(out[mark:])
+            del out[mark:]
+            out.append(_render_tag(current, child_content))
+            continue
+        if not isinstance(current, dict):
+            continue
+        if current.get("type") == "text":
+            out.append(html.unescape(current.get("content", "")))
+            continue
+        stack.append((current, len(out)))
+        stack.extend((c, -1) for c in reversed(current.get("content", [])))
+
+
+def _render_tag(node: Dict[str, Any], child_content: str) -> str:
     tag = node.get("tag")
-    content = node.get("content", [])
-    if node_type == "text":
-        return node.get("content", "")
-    child_content = "".join(_parse_json_node_to_markdown(c) for c in content)
-    tag_map = {
-        "p": f"{child_content.strip()}\n\n",
-        "h2": f"## {child_content.strip()}\n\n",
-        "h3": f"### {child_content.strip()}\n\n",
-        "a": f"[{child_content}]({_abs_url(node.get('attrs', {}).get('href', ''))})",
-        "ul": f"{child_content}\n",
-        "li": f"- {child_content.strip()}\n",
-        "blockquote": "".join(
-            f"> {line}\n" for line in child_content.strip().split("\n")
-        )
-        + "\n",
-        "strong": f"**{child_content}**",
-        "b": f"**{child_content}**",
-        "em": f"*{child_content}*",
-        "i": f"*{child_content}*",
-    }
-    return tag_map.get(tag, child_content)
+    if tag in _STRIPPED_TAG_FORMATS:
+        return _STRIPPED_TAG_FORMATS[tag] % child_content.strip()
+    if tag in _TAG_FORMATS:
+        return _TAG_FORMATS[tag] % child_content
+    if tag == "a":
+        href = _abs_url(html.unescape(node.get("attrs", {}).get("href", "")))
+        return f"[{child_content}]({href})"
+    if tag == "blockquote":
+        lines = child_content.strip().split("\n")
+        return "".join(f"> {line}\n" for line in lines) + "\n"
+    return child_content
+
+
+# Markdown wrappers for body tags, applied to the stripped or raw child text.
+_STRIPPED_TAG_FORMATS = {
+    "p": "%s\n\n",
+    "h2": "## %s\n\n",
+    "h3": "### %s\n\n",
+    "li": "- %s\n",
+}
+_TAG_FORMATS = {
+    "ul": "%s\n",
+    "strong": "**%s**",
+    "b": "**%s**",
+    "em": "*%s*",
+    "i": "*%s*",
+}
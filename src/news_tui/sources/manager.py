@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Type
+import json
+from typing import Any, Dict, Optional, Tuple, Type
 
-from .base import Source
+import requests
+
+from .base import Source, create_session
 from .cbc import CBCSource
 
 # In the future, we could auto-discover sources, but for now, we'll hardcode them.
@@ -12,22 +15,41 @@ AVAILABLE_SOURCES: Dict[str, Type[Source]] = {
 
 
 class SourceManager:
+    # Instances shared across managers as (config key, source) by source name,
+    # so reloading the config only rebuilds sources whose settings changed.
+    _instances: Dict[str, Tuple[str, Source]] = {}
+    # One HTTP session for every source so pooled connections are reused.
+    _session: Optional[requests.Session] = None
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        if SourceManager._session is None:
+            SourceManager._session = create_session()
+        self.session = SourceManager._session
         self.sources: Dict[str, Source] = {}
         self._load_sources()
+        # Sources don't change after loading, so build the listing once.
+        self._all_sources: Tuple[Source, ...] = tuple(self.sources.values())
 
     def _load_sources(self) -> None:
         """Load all available sources."""
         source_config = self.config.get("sources", {})
         for name, source_class in AVAILABLE_SOURCES.items():
             if name in source_config:
-                self.sources[name] = source_class(source_config[name])
+                key = json.dumps(source_config[name], sort_keys=True)
+                cached = self._instances.get(name)
+                if cached is None or cached[0] != key:
+                    # Replacing the entry drops the old source and its caches.
+                    cached = self._instances[name] = (
+                        key,
+                        source_class(source_config[name], session=self.session),
+                    )
+                self.sources[name] = cached[1]
 
     def get_source(self, name: str) -> Source | None:
         """Get a source by name."""
         return self.sources.get(name)
 
-    def get_all_sources(self) -> List[Source]:
-        """Get a list of all loaded sources."""
-        return list(self.sources.values())
+    def get_all_sources(self) -> Tuple[Source, ...]:
+        """Get all loaded sources."""
+        return self._all_sources
@@ -3,7 +3,6 @@ from __future__ import annotations
 from datetime import datetime
 
 from textual.app import ComposeResult
-from textual.containers import Horizontal
 from textual.widgets import Checkbox, ListItem, Static
 from textual.reactive import reactive
 from rich.text import Text
@@ -31,35 +30,57 @@ class HeadlineItem(ListItem):
     def __init__(self, story: Story):
         super().__init__()
         self.story = story
+        # Built once up front. The text is plain rather than markup: there is
+        # nothing to parse, and titles such as "[Video] ..." render as-is.
+        self._cells = (
+            Static(story.section, classes="headline-section", markup=False),
+            Static(story.flag or "", classes="headline-flag", markup=False),
+            Static(story.title, classes="headline-title", markup=False),
+        )
 
     def compose(self) -> ComposeResult:
-        with Horizontal(classes="headline-container"):
-            yield Static(self.story.section, classes="headline-section")
-            yield Static(self.story.flag or "", classes="headline-flag")
-            yield Static(self.story.title, classes="headline-title")
+        # The item lays its cells out horizontally itself (see app.css), so
+        # each row is three widgets without a wrapping container.
+        yield from self._cells
 
 
 class StatusBar(Static):
     loading_status = reactive("")
     keybinding_hint = reactive("")
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Last text passed to update(), so unchanged states don't re-render.
+        self._rendered: str | None = None
+        # Hint with a {color} placeholder, and the theme colour last used for it.
+        self._hint_template = ""
+        self._key_color: str | None = None
+
     def on_mount(self) -> None:
         self.update_display()
 
     def set_keybindings(self, hint: str) -> None:
-        """Set the keybinding hint text."""
-        self.keybinding_hint = hint
+        """Set the keybinding hint text; ``{color}`` becomes the theme's key colour."""
+        self._hint_template = hint
+        if self._key_color is None:
+            self._key_color = self.app.get_keybinding_style()
+        self.keybinding_hint = hint.format(color=self._key_color)
+
+    def refresh_key_color(self) -> None:
+        """Re-colour the keybinding hint after a theme change."""
+        color = self.app.get_keybinding_style()
+        if color != self._key_color:
+            self._key_color = color
+            self.keybinding_hint = self._hint_template.format(color=color)
 
     def update_display(self) -> None:
         """Update the status bar display."""
-        status_items = []
-        if self.loading_status:
-            status_items.append(self.loading_status)
-
-        if self.keybinding_hint:
-            status_items.append(self.keybinding_hint)
-
-        self.update(" | ".join(status_items))
+        text = " | ".join(
+            item for item in (self.loading_status, self.keybinding_hint) if item
+        )
+        if text != self._rendered:
+            self._rendered = text
+            self.update(text)
 
     def watch_loading_status(self, loading_status: str) -> None:
         self.update_display()